@@ -5,6 +5,8 @@ For v0.2, this focuses on file operations. Future versions will add
 database and API call analysis.
 """
 
+import copy
+import re
 from pathlib import Path
 
 import structlog
@@ -69,6 +71,33 @@ class ImpactAnalyzer:
         "secret_key",
     ]
 
+    # Especially dangerous shell command tokens
+    DANGEROUS_COMMANDS = ["rm", "rmdir", "del", "format", "dd", "mkfs", ">", ">>"]
+
+    # Fused alternation over the dangerous/privileged tokens, compiled once.
+    # Most commands contain none of them, so a single scan rejects the
+    # common case before the per-token loop (which must report every match).
+    _SHELL_DANGER_RE = re.compile(
+        "|".join(re.escape(token) for token in DANGEROUS_COMMANDS + ["sudo", "admin"])
+    )
+
+    # Anchored SQL statement classifier: one case-insensitive match instead
+    # of upper-casing the whole query and probing prefixes in sequence.
+    _SQL_KEYWORD_RE = re.compile(
+        r"\s*(SELECT|INSERT|UPDATE|DELETE|DROP|TRUNCATE|ALTER)\b",
+        re.IGNORECASE,
+    )
+
+    _SQL_KEYWORD_RISK = {
+        "SELECT": (RiskLevel.LOW, "Read-only query"),
+        "INSERT": (RiskLevel.MEDIUM, "Data modification"),
+        "UPDATE": (RiskLevel.MEDIUM, "Data modification"),
+        "DELETE": (RiskLevel.CRITICAL, "Destructive operation"),
+        "DROP": (RiskLevel.CRITICAL, "Destructive operation"),
+        "TRUNCATE": (RiskLevel.CRITICAL, "Destructive operation"),
+        "ALTER": (RiskLevel.CRITICAL, "Destructive operation"),
+    }
+
     def __init__(self, working_directory: str | None = None):
         """
         Initialize analyzer.
@@ -78,6 +107,16 @@ class ImpactAnalyzer:
         """
         self.working_dir = Path(working_directory) if working_directory else Path.cwd()
 
+    def with_working_directory(self, working_directory: str | Path) -> "ImpactAnalyzer":
+        """Return a copy of this analyzer rooted at another directory.
+
+        Per-instance state is just the working directory, so the copy is
+        cheap; rule tables and the shared scanner are class/module level.
+        """
+        clone = copy.copy(self)
+        clone.working_dir = Path(working_directory)
+        return clone
+
     async def analyze(self, request: ActionRequest) -> ActionPreview:
         """
         Generate impact preview for a proposed action.
@@ -242,17 +281,18 @@ class ImpactAnalyzer:
         risk_level = RiskLevel.HIGH
         warnings = []
 
-        # Check for especially dangerous commands
-        dangerous_commands = ["rm", "rmdir", "del", "format", "dd", "mkfs", ">", ">>"]
-        for cmd in dangerous_commands:
-            if cmd in command.lower():
-                risk_level = RiskLevel.CRITICAL
-                risk_factors.append(f"Contains dangerous command: {cmd}")
+        command_lower = command.lower()
+        if self._SHELL_DANGER_RE.search(command_lower):
+            # Check for especially dangerous commands
+            for cmd in self.DANGEROUS_COMMANDS:
+                if cmd in command_lower:
+                    risk_level = RiskLevel.CRITICAL
+                    risk_factors.append(f"Contains dangerous command: {cmd}")
 
-        # Check for sudo/admin
-        if "sudo" in command.lower() or "admin" in command.lower():
-            risk_level = RiskLevel.CRITICAL
-            risk_factors.append("Elevated privileges requested")
+            # Check for sudo/admin
+            if "sudo" in command_lower or "admin" in command_lower:
+                risk_level = RiskLevel.CRITICAL
+                risk_factors.append("Elevated privileges requested")
 
         warnings.append("Shell commands cannot be previewed - only the command itself is shown")
 
@@ -272,17 +312,12 @@ class ImpactAnalyzer:
         query = request.payload.get("query", request.target)
 
         # Basic classification
-        query_upper = query.upper().strip()
+        match = self._SQL_KEYWORD_RE.match(query)
+        keyword = match.group(1).upper() if match else None
 
-        if query_upper.startswith("SELECT"):
-            risk_level = RiskLevel.LOW
-            risk_factors = ["Read-only query"]
-        elif query_upper.startswith(("INSERT", "UPDATE")):
-            risk_level = RiskLevel.MEDIUM
-            risk_factors = ["Data modification"]
-        elif query_upper.startswith(("DELETE", "DROP", "TRUNCATE", "ALTER")):
-            risk_level = RiskLevel.CRITICAL
-            risk_factors = ["Destructive operation"]
+        if keyword is not None:
+            risk_level, factor = self._SQL_KEYWORD_RISK[keyword]
+            risk_factors = [factor]
         else:
             risk_level = RiskLevel.MEDIUM
             risk_factors = ["Unknown query type"]
@@ -294,7 +329,7 @@ class ImpactAnalyzer:
             summary=f"Execute SQL: {query[:100]}{'...' if len(query) > 100 else ''}",
             affected_count=0,
             warnings=["Full database preview coming in v0.3"],
-            is_reversible=not query_upper.startswith(("DROP", "TRUNCATE")),
+            is_reversible=keyword not in ("DROP", "TRUNCATE"),
         )
 
     async def _analyze_api_call(self, request: ActionRequest) -> ActionPreview:
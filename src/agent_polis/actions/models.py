@@ -12,7 +12,7 @@ from enum import Enum
 from typing import Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ActionType(str, Enum):
@@ -51,6 +51,8 @@ class RiskLevel(str, Enum):
 class FileChange(BaseModel):
     """Represents a change to a single file."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     path: str = Field(description="File path (relative or absolute)")
     operation: str = Field(description="Operation type: create, modify, delete, move")
 
@@ -91,6 +93,8 @@ class ActionRequest(BaseModel):
     that requires human approval.
     """
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     action_type: ActionType = Field(
         description="Type of action being proposed",
     )
@@ -144,6 +148,9 @@ class ActionPreview(BaseModel):
     This is the core value proposition - show the diff BEFORE execution.
     """
 
+    # Not frozen: the analyzer escalates risk_level in place after scanning.
+    model_config = ConfigDict(extra="ignore")
+
     # What will change
     file_changes: list[FileChange] = Field(
         default_factory=list,
@@ -192,6 +199,8 @@ class ActionPreview(BaseModel):
 class ActionResponse(BaseModel):
     """Response model for action operations."""
 
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
     id: UUID = Field(default_factory=uuid4)
 
     # Request details
@@ -223,8 +232,8 @@ class ActionResponse(BaseModel):
     agent_id: UUID | None = Field(default=None)
     agent_name: str | None = Field(default=None)
 
-    class Config:
-        from_attributes = True
+    # Event audit trail (populated only when requested via ?include=events)
+    events: list[dict[str, Any]] | None = Field(default=None)
 
 
 class ActionListResponse(BaseModel):
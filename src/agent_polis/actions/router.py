@@ -8,11 +8,14 @@ These endpoints handle:
 - Executing approved actions
 """
 
-from typing import Annotated
+import json
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Annotated
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agent_polis.actions.diff import format_diff_plain, format_diff_terminal
@@ -27,15 +30,33 @@ from agent_polis.actions.service import ActionService
 from agent_polis.shared.db import get_db
 from agent_polis.shared.security import CurrentAgent
 
+if TYPE_CHECKING:
+    from agent_polis.events.models import Event
+
 logger = structlog.get_logger()
 router = APIRouter()
 
 
+def _serialize_event(event: "Event") -> dict:
+    """Render a stored event for API output."""
+    return {
+        "id": str(event.id),
+        "type": event.event_type,
+        "data": event.event_data,
+        "metadata": event.event_metadata,
+        "created_at": event.created_at.isoformat(),
+    }
+
+
 @router.post("/", response_model=ActionResponse, status_code=status.HTTP_201_CREATED)
 async def submit_action(
     request: ActionRequest,
     agent: CurrentAgent,
     db: Annotated[AsyncSession, Depends(get_db)],
+    include: str | None = Query(
+        default=None,
+        description="Optional related data to embed: 'events' for the audit trail",
+    ),
 ) -> ActionResponse:
     """
     Submit a proposed action for approval.
@@ -45,6 +66,9 @@ async def submit_action(
 
     If `auto_approve_if_low_risk` is True and the action is assessed as
     low risk, it will be automatically approved.
+
+    Pass `?include=events` to embed the action's audit trail in the
+    response and save a follow-up `GET /{action_id}/events` round-trip.
     """
     service = ActionService(db)
 
@@ -54,6 +78,13 @@ async def submit_action(
     # Attach agent name for response
     response.agent_name = agent.name
 
+    if include == "events":
+        from agent_polis.events.store import EventStore
+
+        event_store = EventStore(db)
+        events = await event_store.get_stream(f"action:{action.id}")
+        response.events = [_serialize_event(e) for e in events]
+
     return response
 
 
@@ -317,17 +348,23 @@ async def execute_action(
     return service.to_response(action)
 
 
-@router.get("/{action_id}/events")
+@router.get("/{action_id}/events", response_model=None)
 async def get_action_events(
     action_id: UUID,
     agent: CurrentAgent,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[dict]:
+    accept: Annotated[str | None, Header()] = None,
+) -> list[dict] | StreamingResponse:
     """
     Get the event history for an action.
 
     Returns a complete audit trail of everything that happened
     with this action - useful for compliance and debugging.
+
+    With `Accept: application/x-ndjson` the trail streams as one JSON
+    object per line, so clients can process events incrementally and
+    stop reading as soon as they have what they need instead of
+    buffering and parsing the whole array.
     """
     from agent_polis.events.store import EventStore
 
@@ -343,13 +380,11 @@ async def get_action_events(
     event_store = EventStore(db)
     events = await event_store.get_stream(f"action:{action_id}")
 
-    return [
-        {
-            "id": str(e.id),
-            "type": e.event_type,
-            "data": e.event_data,
-            "metadata": e.event_metadata,
-            "created_at": e.created_at.isoformat(),
-        }
-        for e in events
-    ]
+    if accept and "application/x-ndjson" in accept:
+        def iter_ndjson() -> Iterator[str]:
+            for event in events:
+                yield json.dumps(_serialize_event(event)) + "\n"
+
+        return StreamingResponse(iter_ndjson(), media_type="application/x-ndjson")
+
+    return [_serialize_event(e) for e in events]
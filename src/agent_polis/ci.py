@@ -10,6 +10,7 @@ import argparse
 import asyncio
 import json
 import sys
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any, Literal
 
@@ -23,6 +24,9 @@ from agent_polis.governance.prompt_scanner import PromptInjectionScanner
 
 REPORT_SCHEMA_VERSION = "1"
 
+# Async callable producing a preview for an action; defaults to ImpactAnalyzer.
+PreviewProvider = Callable[[ActionRequest], Awaitable[ActionPreview]]
+
 
 class CIActionReport(BaseModel):
     """Per-action report entry."""
@@ -72,9 +76,16 @@ async def generate_ci_report(
     policy: PolicyConfig,
     *,
     working_directory: str | None = None,
+    preview_provider: PreviewProvider | None = None,
 ) -> tuple[CIPolicyReport, int]:
-    """Evaluate actions deterministically and return (report, exit_code)."""
-    analyzer = ImpactAnalyzer(working_directory=working_directory)
+    """Evaluate actions deterministically and return (report, exit_code).
+
+    `preview_provider` lets callers substitute the full impact analyzer,
+    e.g. tests that only exercise the policy path can supply a canned
+    preview instead of paying for filesystem analysis.
+    """
+    if preview_provider is None:
+        preview_provider = ImpactAnalyzer(working_directory=working_directory).analyze
     evaluator = PolicyEvaluator()
     scanner = PromptInjectionScanner()
 
@@ -86,7 +97,7 @@ async def generate_ci_report(
     totals = {"allow": 0, "require_approval": 0, "deny": 0}
 
     for idx, request in enumerate(actions):
-        preview: ActionPreview = await analyzer.analyze(request)
+        preview: ActionPreview = await preview_provider(request)
         scan = scanner.scan_action_request(request)
         policy_result = evaluator.evaluate(policy, request, risk_level=preview.risk_level)
 
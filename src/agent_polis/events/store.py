@@ -99,6 +99,81 @@ class EventStore:
 
         return db_event
 
+    async def append_many(
+        self,
+        events: Sequence[DomainEvent],
+        actor_id: str | None = None,
+        correlation_id: str | None = None,
+    ) -> list[Event]:
+        """
+        Append a batch of events with a single flush.
+
+        Stream versions and the hash chain are computed in Python from one
+        tail lookup per stream, so a batch of N events costs one SELECT per
+        stream plus one INSERT flush instead of N of each.
+
+        Args:
+            events: Domain events to append, in order
+            actor_id: Optional ID of the agent/user who caused these events
+            correlation_id: Optional ID for correlating related events
+
+        Returns:
+            The persisted Event records, in input order
+
+        Raises:
+            IntegrityError: If stream version conflict (optimistic concurrency)
+        """
+        if not events:
+            return []
+
+        # Current tail (version, hash) for each stream touched by the batch
+        tails: dict[str, tuple[int, str | None]] = {}
+        for stream_id in {e.stream_id for e in events}:
+            result = await self.session.execute(
+                select(Event.stream_version, Event.hash)
+                .where(Event.stream_id == stream_id)
+                .order_by(Event.stream_version.desc())
+                .limit(1)
+            )
+            row = result.first()
+            tails[stream_id] = (row.stream_version, row.hash) if row else (0, None)
+
+        db_events: list[Event] = []
+        for event in events:
+            version, prev_hash = tails[event.stream_id]
+
+            metadata = {
+                **event.metadata,
+                "event_id": str(event.event_id),
+                "occurred_at": event.occurred_at.isoformat(),
+            }
+            if actor_id:
+                metadata["actor_id"] = actor_id
+            if correlation_id:
+                metadata["correlation_id"] = correlation_id
+
+            db_event = Event.create(
+                stream_id=event.stream_id,
+                stream_version=version + 1,
+                event_type=event.event_type,
+                event_data=event.data,
+                metadata=metadata,
+                prev_hash=prev_hash,
+            )
+            db_events.append(db_event)
+            tails[event.stream_id] = (version + 1, db_event.hash)
+
+        self.session.add_all(db_events)
+        await self.session.flush()
+
+        logger.info(
+            "Events appended",
+            count=len(db_events),
+            streams=len(tails),
+        )
+
+        return db_events
+
     async def get_stream(
         self,
         stream_id: str,
@@ -43,9 +43,16 @@ def canonicalize_descriptor(descriptor: Mapping[str, Any]) -> str:
 
 
 def compute_descriptor_hash(descriptor: Mapping[str, Any]) -> str:
-    """Compute canonical SHA-256 hash for a descriptor payload."""
-    canonical = canonicalize_descriptor(descriptor)
-    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    """Compute canonical SHA-256 hash for a descriptor payload.
+
+    Always hashes the stdlib `canonicalize_descriptor` encoding. An orjson
+    fast path is deliberately not used here: orjson formats some values
+    differently (float exponent notation, big-int rejection), and a pin
+    computed on one encoding would fail verification on the other.
+    """
+    digest = hashlib.sha256(
+        canonicalize_descriptor(descriptor).encode("utf-8")
+    ).hexdigest()
     return f"{_HASH_PREFIX}{digest}"
 
 
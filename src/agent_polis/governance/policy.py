@@ -4,11 +4,19 @@ from __future__ import annotations
 
 import fnmatch
 import json
+import os
+import re
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field, ValidationError, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError, model_validator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional perf dependency
+    orjson = None  # type: ignore[assignment]
 
 from agent_polis.actions.models import ActionRequest, ActionType, RiskLevel
 
@@ -33,6 +41,13 @@ def _risk_severity(level: RiskLevel) -> int:
     return _RISK_ORDER[level]
 
 
+# One bit per action type; rule matching compares masks instead of
+# probing a hash set per evaluation.
+_ACTION_TYPE_BITS = {
+    action_type: 1 << index for index, action_type in enumerate(ActionType)
+}
+
+
 class PolicyDefaults(BaseModel):
     """Default behavior when no rules match."""
 
@@ -55,6 +70,13 @@ class PolicyRule(BaseModel):
     max_risk_level: RiskLevel | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    # Compiled alternation of path_globs, built lazily on first match
+    _glob_re: re.Pattern[str] | None = PrivateAttr(default=None)
+    # Specificity score, computed once on first use
+    _specificity: int | None = PrivateAttr(default=None)
+    # Bitmask over action_types, computed once on first use
+    _action_mask: int | None = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def validate_risk_bounds(self) -> PolicyRule:
         if self.min_risk_level and self.max_risk_level:
@@ -62,15 +84,45 @@ class PolicyRule(BaseModel):
                 raise ValueError("max_risk_level cannot be lower than min_risk_level")
         return self
 
+    def matches_path(self, target: str) -> bool:
+        """True if the target matches any path glob (fnmatch semantics).
+
+        The globs are translated and compiled into one alternation regex
+        the first time a rule is evaluated, instead of re-running fnmatch
+        per glob on every evaluation.
+        """
+        pattern = self._glob_re
+        if pattern is None:
+            pattern = re.compile(
+                "|".join(
+                    fnmatch.translate(os.path.normcase(glob))
+                    for glob in self.path_globs
+                )
+            )
+            self._glob_re = pattern
+        return pattern.match(os.path.normcase(target)) is not None
+
+    def action_mask(self) -> int:
+        """Bitmask of this rule's action types (0 means match any)."""
+        mask = self._action_mask
+        if mask is None:
+            mask = self._action_mask = sum(
+                _ACTION_TYPE_BITS[action_type] for action_type in self.action_types
+            )
+        return mask
+
     def specificity(self) -> int:
         """Higher values indicate more constrained rules."""
-        return (
-            (1 if self.action_types else 0)
-            + (1 if self.path_globs else 0)
-            + (1 if self.target_contains else 0)
-            + (1 if self.min_risk_level is not None else 0)
-            + (1 if self.max_risk_level is not None else 0)
-        )
+        spec = self._specificity
+        if spec is None:
+            spec = self._specificity = (
+                (1 if self.action_types else 0)
+                + (1 if self.path_globs else 0)
+                + (1 if self.target_contains else 0)
+                + (1 if self.min_risk_level is not None else 0)
+                + (1 if self.max_risk_level is not None else 0)
+            )
+        return spec
 
 
 class PolicyConfig(BaseModel):
@@ -81,6 +133,35 @@ class PolicyConfig(BaseModel):
     defaults: PolicyDefaults = Field(default_factory=PolicyDefaults)
     rules: list[PolicyRule] = Field(default_factory=list)
 
+    # Enabled rules in canonical evaluation order, computed once per policy
+    _ordered_rules: tuple[tuple[int, int, int, PolicyRule], ...] | None = PrivateAttr(
+        default=None
+    )
+    # Bounded LRU of evaluation results keyed by evaluation input
+    _decision_cache: (
+        OrderedDict[tuple[ActionType, str, RiskLevel], PolicyEvaluationResult] | None
+    ) = PrivateAttr(default=None)
+
+    def ordered_rules(self) -> tuple[tuple[int, int, int, PolicyRule], ...]:
+        """Enabled rules as (priority, specificity, index, rule) tuples.
+
+        Sorted by (priority, -specificity, index) so evaluation can stop at
+        the first matching rule; computed lazily and cached on the policy.
+        """
+        ordered = self._ordered_rules
+        if ordered is None:
+            ordered = self._ordered_rules = tuple(
+                sorted(
+                    (
+                        (rule.priority, rule.specificity(), idx, rule)
+                        for idx, rule in enumerate(self.rules)
+                        if rule.enabled
+                    ),
+                    key=lambda item: (item[0], -item[1], item[2]),
+                )
+            )
+        return ordered
+
     @model_validator(mode="after")
     def validate_unique_rule_ids(self) -> PolicyConfig:
         seen: set[str] = set()
@@ -130,6 +211,9 @@ class PolicyEvaluationResult(BaseModel):
 class PolicyEvaluator:
     """Deterministic policy evaluator with trace output."""
 
+    # Cap on cached decisions per policy (tiny input spaces in practice)
+    DECISION_CACHE_SIZE = 10_000
+
     def evaluate(
         self,
         policy: PolicyConfig,
@@ -145,51 +229,67 @@ class PolicyEvaluator:
         else:
             eval_input = request_or_input
 
-        candidates: list[tuple[int, int, int, PolicyRule]] = []
-        trace: list[str] = []
-
-        for idx, rule in enumerate(policy.rules):
-            if not rule.enabled:
-                trace.append(f"skip:{rule.id}:disabled")
-                continue
-            if self._matches(rule, eval_input):
-                spec = rule.specificity()
-                candidates.append((rule.priority, -spec, idx, rule))
-                trace.append(
-                    f"match:{rule.id}:priority={rule.priority}:specificity={spec}"
-                )
-            else:
+        # Decisions depend only on (action_type, target, risk_level), so
+        # repeat evaluations are a dict hit. Cached copies keep callers
+        # from mutating shared results.
+        cache = policy._decision_cache
+        if cache is None:
+            cache = policy._decision_cache = OrderedDict()
+        cache_key = (eval_input.action_type, eval_input.target, eval_input.risk_level)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            cache.move_to_end(cache_key)
+            return cached.model_copy(deep=True)
+
+        result = self._evaluate_uncached(policy, eval_input)
+        cache[cache_key] = result.model_copy(deep=True)
+        if len(cache) > self.DECISION_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
+    def _evaluate_uncached(
+        self,
+        policy: PolicyConfig,
+        eval_input: PolicyEvaluationInput,
+    ) -> PolicyEvaluationResult:
+        trace: list[str] = [
+            f"skip:{rule.id}:disabled" for rule in policy.rules if not rule.enabled
+        ]
+
+        # Rules are pre-sorted by (priority, -specificity, order), so the
+        # first match is the winning rule and evaluation can stop there.
+        for priority, spec, _, rule in policy.ordered_rules():
+            if not self._matches(rule, eval_input):
                 trace.append(f"skip:{rule.id}:no-match")
-
-        if not candidates:
+                continue
+            trace.append(
+                f"match:{rule.id}:priority={priority}:specificity={spec}"
+            )
             trace.append(
-                f"default:{policy.defaults.decision.value}:no-matching-rules"
+                f"selected:{rule.id}:priority={priority}:specificity={spec}"
             )
             return PolicyEvaluationResult(
-                decision=policy.defaults.decision,
+                decision=rule.decision,
+                matched_rule_id=rule.id,
+                matched_rule_priority=priority,
+                matched_rule_specificity=spec,
                 trace=trace,
             )
 
-        priority, neg_spec, _, rule = min(candidates)
-        specificity = -neg_spec
         trace.append(
-            f"selected:{rule.id}:priority={priority}:specificity={specificity}"
+            f"default:{policy.defaults.decision.value}:no-matching-rules"
         )
         return PolicyEvaluationResult(
-            decision=rule.decision,
-            matched_rule_id=rule.id,
-            matched_rule_priority=priority,
-            matched_rule_specificity=specificity,
+            decision=policy.defaults.decision,
             trace=trace,
         )
 
     def _matches(self, rule: PolicyRule, data: PolicyEvaluationInput) -> bool:
-        if rule.action_types and data.action_type not in rule.action_types:
+        mask = rule.action_mask()
+        if mask and not (mask & _ACTION_TYPE_BITS[data.action_type]):
             return False
 
-        if rule.path_globs and not any(
-            fnmatch.fnmatch(data.target, pattern) for pattern in rule.path_globs
-        ):
+        if rule.path_globs and not rule.matches_path(data.target):
             return False
 
         if rule.target_contains:
@@ -219,7 +319,7 @@ def load_policy_from_dict(data: dict[str, Any]) -> PolicyConfig:
 def load_policy_from_file(path: str | Path) -> PolicyConfig:
     """Load a policy from JSON or YAML file."""
     policy_path = Path(path)
-    raw = policy_path.read_text(encoding="utf-8")
+    raw = policy_path.read_bytes()
     suffix = policy_path.suffix.lower()
 
     if suffix in {".yaml", ".yml"}:
@@ -227,7 +327,10 @@ def load_policy_from_file(path: str | Path) -> PolicyConfig:
             import yaml
         except ImportError as exc:
             raise ValueError("PyYAML is required to parse YAML policy files") from exc
-        parsed = yaml.safe_load(raw)
+        parsed = yaml.safe_load(raw.decode("utf-8"))
+    elif orjson is not None:
+        # Decodes straight from the file bytes, skipping the text round-trip.
+        parsed = orjson.loads(raw)
     else:
         parsed = json.loads(raw)
 
@@ -7,6 +7,7 @@ at load time, so callers get deterministic diagnostics on failure.
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -240,9 +241,25 @@ def get_policy_preset_metadata(preset_id: str) -> PolicyPresetMetadata:
     return _PRESET_METADATA[preset_id]
 
 
+@functools.cache
 def load_policy_preset(preset_id: str) -> PolicyConfig:
-    """Load and validate a bundled policy preset by ID."""
+    """Load and validate a bundled policy preset by ID.
+
+    Presets are static, so validation runs once per interpreter and the
+    same PolicyConfig instance is returned to every caller; treat it as
+    read-only. Failed loads are not cached.
+    """
     if preset_id not in _PRESET_POLICIES:
         available = ", ".join(sorted(_PRESET_POLICIES.keys()))
         raise ValueError(f"Unknown preset id '{preset_id}'. Available: {available}")
-    return load_policy_from_dict(_PRESET_POLICIES[preset_id])
+    policy = load_policy_from_dict(_PRESET_POLICIES[preset_id])
+
+    # Warm the lazily-derived evaluation state (rule ordering, specificity,
+    # action-type masks, compiled globs) so the first evaluation against a
+    # preset pays none of it.
+    for _, _, _, rule in policy.ordered_rules():
+        rule.action_mask()
+        if rule.path_globs:
+            rule.matches_path("")
+
+    return policy
@@ -7,7 +7,10 @@ This module is intentionally conservative and bounded:
 
 from __future__ import annotations
 
+import functools
 import re
+import sys
+from collections import OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
@@ -47,6 +50,15 @@ def severity_to_risk_level(severity: ScanSeverity) -> RiskLevel:
     return _SEVERITY_TO_RISK[severity]
 
 
+# Interned field names used on every request scan; identity-equal strings
+# let the scan-cache and dedupe dict lookups take CPython's pointer-compare
+# fast path instead of hashing fresh literals per call.
+_FIELD_DESCRIPTION = sys.intern("description")
+_FIELD_TARGET = sys.intern("target")
+_FIELD_CONTEXT = sys.intern("context")
+_FIELD_PAYLOAD = sys.intern("payload")
+
+
 class ScanFinding(BaseModel):
     """A single scanner finding with machine-readable reason ID."""
 
@@ -88,6 +100,21 @@ class _ScannerRule:
     pattern: re.Pattern[str]
 
 
+@functools.lru_cache(maxsize=8)
+def _combined_prefilter(rules: tuple[_ScannerRule, ...]) -> re.Pattern[str]:
+    """Fuse a ruleset into one alternation used as a cheap pre-filter.
+
+    Compiled with the superset of the rules' flags, so it can only
+    over-match: a hit still goes through the per-rule scan for exact
+    findings, while the (overwhelmingly common) clean input is rejected
+    in a single regex pass instead of one search per rule.
+    """
+    return re.compile(
+        "|".join(f"(?:{rule.pattern.pattern})" for rule in rules),
+        flags=re.IGNORECASE | re.DOTALL,
+    )
+
+
 class PromptInjectionScanner:
     """Rule-based scanner for prompt injection and risky instructions."""
 
@@ -96,6 +123,9 @@ class PromptInjectionScanner:
     DEFAULT_MAX_PAYLOAD_STRINGS = 500
     DEFAULT_MAX_PAYLOAD_DEPTH = 32
 
+    # Cap on cached per-text scan results (LRU eviction beyond this)
+    SCAN_CACHE_SIZE = 4096
+
     DEFAULT_RULES: tuple[_ScannerRule, ...] = (
         _ScannerRule(
             reason_id="prompt_injection.ignore_instructions",
@@ -166,6 +196,10 @@ class PromptInjectionScanner:
         max_payload_depth: int = DEFAULT_MAX_PAYLOAD_DEPTH,
     ) -> None:
         self.rules = tuple(rules) if rules is not None else self.DEFAULT_RULES
+        self._prefilter = _combined_prefilter(self.rules) if self.rules else None
+        self._scan_cache: OrderedDict[tuple[str, str], tuple[ScanFinding, ...]] = (
+            OrderedDict()
+        )
         self.max_text_chars = max(1, max_text_chars)
         self.max_payload_strings = max(0, max_payload_strings)
         self.max_payload_depth = max(0, max_payload_depth)
@@ -173,22 +207,38 @@ class PromptInjectionScanner:
     def scan_action_request(self, request: ActionRequest) -> ScanResult:
         """Scan action request inputs and payload metadata."""
         findings: list[ScanFinding] = []
-        findings.extend(self.scan_text(request.description, field="description"))
-        findings.extend(self.scan_text(request.target, field="target"))
+        findings.extend(self.scan_text(request.description, field=_FIELD_DESCRIPTION))
+        findings.extend(self.scan_text(request.target, field=_FIELD_TARGET))
 
         if request.context:
-            findings.extend(self.scan_text(request.context, field="context"))
+            findings.extend(self.scan_text(request.context, field=_FIELD_CONTEXT))
 
         findings.extend(self.scan_payload(request.payload))
         return ScanResult(findings=self._dedupe_findings(findings))
 
     def scan_text(self, text: str, field: str) -> list[ScanFinding]:
-        """Scan a text segment and return matching findings."""
+        """Scan a text segment and return matching findings.
+
+        Results are cached per (field, text) in a bounded LRU: agent loops
+        re-scan identical inputs (overwhelmingly benign) constantly, and a
+        hit skips the regex pipeline entirely. Findings are immutable, so
+        sharing them across hits is safe.
+        """
         if not text.strip():
             return []
 
         text_to_scan = text[: self.max_text_chars]
 
+        cache_key = (field, text_to_scan)
+        cached = self._scan_cache.get(cache_key)
+        if cached is not None:
+            self._scan_cache.move_to_end(cache_key)
+            return list(cached)
+
+        if self._prefilter is None or not self._prefilter.search(text_to_scan):
+            self._cache_scan(cache_key, ())
+            return []
+
         findings: list[ScanFinding] = []
         for rule in self.rules:
             match = rule.pattern.search(text_to_scan)
@@ -204,15 +254,36 @@ class PromptInjectionScanner:
                     snippet=snippet,
                 )
             )
+        self._cache_scan(cache_key, tuple(findings))
         return findings
 
+    def _cache_scan(
+        self,
+        key: tuple[str, str],
+        findings: tuple[ScanFinding, ...],
+    ) -> None:
+        self._scan_cache[key] = findings
+        if len(self._scan_cache) > self.SCAN_CACHE_SIZE:
+            self._scan_cache.popitem(last=False)
+
     def scan_payload(self, payload: dict[str, Any]) -> list[ScanFinding]:
         """Scan payload for risky strings in metadata/instructions.
 
-        Uses an explicit stack instead of recursion to avoid recursion-depth crashes.
+        Uses an explicit stack instead of recursion to avoid recursion-depth
+        crashes. The collected strings are joined on a record separator and
+        pre-filtered in one fused-regex pass; the per-string scan (which
+        attributes findings to their payload field) only runs on a hit.
         """
+        fields = list(self._iter_string_fields(payload, prefix=_FIELD_PAYLOAD))
+        if not fields or self._prefilter is None:
+            return []
+
+        blob = "\x1e".join(value[: self.max_text_chars] for _, value in fields)
+        if not self._prefilter.search(blob):
+            return []
+
         findings: list[ScanFinding] = []
-        for field, value in self._iter_string_fields(payload, prefix="payload"):
+        for field, value in fields:
             findings.extend(self.scan_text(value, field=field))
         return findings
 
@@ -224,29 +295,39 @@ class PromptInjectionScanner:
         stack: list[tuple[Any, str, int]] = [(value, prefix, 0)]
         yielded_strings = 0
 
+        # Bind the bounds and stack methods once; this loop runs for every
+        # payload node and per-iteration attribute loads add up.
+        max_depth = self.max_payload_depth
+        max_strings = self.max_payload_strings
+        push = stack.append
+
         while stack:
             current, current_prefix, depth = stack.pop()
 
-            if self.max_payload_depth and depth > self.max_payload_depth:
+            if max_depth and depth > max_depth:
                 continue
 
             if isinstance(current, str):
                 yield current_prefix, current
                 yielded_strings += 1
-                if self.max_payload_strings and yielded_strings >= self.max_payload_strings:
+                if max_strings and yielded_strings >= max_strings:
                     return
                 continue
 
             if isinstance(current, dict):
                 # Push in reverse to preserve a stable-ish traversal order.
-                for key, nested in reversed(list(current.items())):
-                    key_name = str(key)
-                    stack.append((nested, f"{current_prefix}.{key_name}", depth + 1))
+                for key, nested in reversed(current.items()):
+                    push((nested, f"{current_prefix}.{key!s}", depth + 1))
+                continue
+
+            if isinstance(current, list | tuple):
+                for idx in range(len(current) - 1, -1, -1):
+                    push((current[idx], f"{current_prefix}[{idx}]", depth + 1))
                 continue
 
-            if isinstance(current, list | tuple | set):
+            if isinstance(current, set):
                 for idx, nested in reversed(list(enumerate(current))):
-                    stack.append((nested, f"{current_prefix}[{idx}]", depth + 1))
+                    push((nested, f"{current_prefix}[{idx}]", depth + 1))
 
     def _dedupe_findings(self, findings: list[ScanFinding]) -> list[ScanFinding]:
         deduped: list[ScanFinding] = []
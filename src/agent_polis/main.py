@@ -24,6 +24,24 @@ from agent_polis.shared.logging import setup_logging
 from agent_polis.shared.middleware import RateLimitMiddleware, RequestLoggingMiddleware
 from agent_polis.shared.redis import close_redis
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+class _OrjsonJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson's C serializer."""
+
+    def render(self, content: object) -> bytes:
+        return orjson.dumps(content)
+
+
+# Serialize responses with orjson when the perf extra is installed.
+_default_response_class: type[JSONResponse] = (
+    _OrjsonJSONResponse if orjson is not None else JSONResponse
+)
+
 a2a_router: APIRouter | None
 simulations_router: APIRouter | None
 try:
@@ -66,6 +84,7 @@ app = FastAPI(
     docs_url="/docs" if settings.is_development else None,
     redoc_url="/redoc" if settings.is_development else None,
     lifespan=lifespan,
+    default_response_class=_default_response_class,
 )
 
 # Configure CORS
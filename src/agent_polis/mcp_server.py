@@ -22,32 +22,85 @@ Usage:
     }
 """
 
+import functools
 import os
+import re
+from typing import TYPE_CHECKING
 
 from mcp.server.fastmcp import FastMCP
 
-from agent_polis.actions.analyzer import ImpactAnalyzer
 from agent_polis.actions.diff import format_diff_plain
 from agent_polis.actions.models import ActionRequest, ActionType, RiskLevel
 
+if TYPE_CHECKING:
+    from agent_polis.actions.analyzer import ImpactAnalyzer
+
 # Create MCP server
 mcp = FastMCP(
     "Agent Polis",
     instructions="Impact preview for AI agents - see exactly what will change before any action executes. Use preview tools BEFORE making file changes, running shell commands, or executing database queries.",
 )
 
-# Initialize analyzer with current working directory
-_analyzer = ImpactAnalyzer(working_directory=os.getcwd())
+
+@functools.cache
+def _get_analyzer() -> "ImpactAnalyzer":
+    """Build the analyzer on first use, rooted at the working directory.
+
+    The import is deferred so loading this module (e.g. during test
+    collection or CLI help) does not pull in the analyzer/scanner stack
+    and compile its rule patterns until a preview tool actually runs.
+    """
+    from agent_polis.actions.analyzer import ImpactAnalyzer
+
+    return ImpactAnalyzer(working_directory=os.getcwd())
+
+
+# Emoji per risk level, built once instead of per lookup
+_EMOJI: dict[RiskLevel, str] = {
+    RiskLevel.LOW: "🟢",
+    RiskLevel.MEDIUM: "🟡",
+    RiskLevel.HIGH: "🟠",
+    RiskLevel.CRITICAL: "🔴",
+}
 
 
 def _risk_emoji(risk: RiskLevel) -> str:
     """Get emoji for risk level."""
-    return {
-        RiskLevel.LOW: "🟢",
-        RiskLevel.MEDIUM: "🟡",
-        RiskLevel.HIGH: "🟠",
-        RiskLevel.CRITICAL: "🔴",
-    }.get(risk, "⚪")
+    return _EMOJI.get(risk, "⚪")
+
+
+# Path risk heuristics for check_path_risk, built once at import. The
+# fused alternation rejects clean paths in a single scan; the per-pattern
+# loop only runs on a hit because every matching pattern must be reported.
+_HIGH_RISK_PATH_PATTERNS: tuple[tuple[str, str], ...] = (
+    (".env", "Environment file - may contain secrets"),
+    (".git/", "Git directory - may corrupt repository"),
+    ("credentials", "Credentials file"),
+    ("secrets", "Secrets file"),
+    ("password", "Password file"),
+    (".pem", "Certificate/key file"),
+    (".ssh/", "SSH directory"),
+    ("id_rsa", "SSH private key"),
+    ("/etc/", "System configuration"),
+    ("/var/", "System variable data"),
+    ("/usr/", "System programs"),
+)
+
+_CRITICAL_PATH_PATTERNS: tuple[tuple[str, str], ...] = (
+    ("production", "Production environment"),
+    ("prod.", "Production config"),
+    (".prod", "Production file"),
+    ("database", "Database-related"),
+    ("api_key", "API key"),
+    ("secret_key", "Secret key"),
+)
+
+_PATH_RISK_RE = re.compile(
+    "|".join(
+        re.escape(pattern)
+        for pattern, _ in _HIGH_RISK_PATH_PATTERNS + _CRITICAL_PATH_PATTERNS
+    )
+)
 
 
 @mcp.tool()
@@ -77,7 +130,7 @@ async def preview_file_write(
         payload={"content": content},
     )
 
-    preview = await _analyzer.analyze(request)
+    preview = await _get_analyzer().analyze(request)
 
     # Format output
     output_lines = [
@@ -137,7 +190,7 @@ async def preview_file_create(
         payload={"content": content},
     )
 
-    preview = await _analyzer.analyze(request)
+    preview = await _get_analyzer().analyze(request)
 
     output_lines = [
         f"## Impact Preview: {description}",
@@ -189,7 +242,7 @@ async def preview_file_delete(
         payload={},
     )
 
-    preview = await _analyzer.analyze(request)
+    preview = await _get_analyzer().analyze(request)
 
     output_lines = [
         f"## ⚠️ DELETION Preview: {description}",
@@ -243,7 +296,7 @@ async def preview_shell_command(
         payload={"command": command},
     )
 
-    preview = await _analyzer.analyze(request)
+    preview = await _get_analyzer().analyze(request)
 
     output_lines = [
         f"## Shell Command Preview: {description}",
@@ -305,7 +358,7 @@ async def preview_database_query(
         payload={"query": query},
     )
 
-    preview = await _analyzer.analyze(request)
+    preview = await _get_analyzer().analyze(request)
 
     output_lines = [
         f"## Database Query Preview: {description}",
@@ -352,38 +405,14 @@ def check_path_risk(path: str) -> str:
 
     risks = []
 
-    # Check high-risk patterns
-    high_risk_patterns = [
-        (".env", "Environment file - may contain secrets"),
-        (".git/", "Git directory - may corrupt repository"),
-        ("credentials", "Credentials file"),
-        ("secrets", "Secrets file"),
-        ("password", "Password file"),
-        (".pem", "Certificate/key file"),
-        (".ssh/", "SSH directory"),
-        ("id_rsa", "SSH private key"),
-        ("/etc/", "System configuration"),
-        ("/var/", "System variable data"),
-        ("/usr/", "System programs"),
-    ]
-
-    for pattern, desc in high_risk_patterns:
-        if pattern in path_lower:
-            risks.append(f"🔴 HIGH: {desc} ({pattern})")
-
-    # Check critical patterns
-    critical_patterns = [
-        ("production", "Production environment"),
-        ("prod.", "Production config"),
-        (".prod", "Production file"),
-        ("database", "Database-related"),
-        ("api_key", "API key"),
-        ("secret_key", "Secret key"),
-    ]
+    if _PATH_RISK_RE.search(path_lower):
+        for pattern, desc in _HIGH_RISK_PATH_PATTERNS:
+            if pattern in path_lower:
+                risks.append(f"🔴 HIGH: {desc} ({pattern})")
 
-    for pattern, desc in critical_patterns:
-        if pattern in path_lower:
-            risks.append(f"🔴 CRITICAL: {desc} ({pattern})")
+        for pattern, desc in _CRITICAL_PATH_PATTERNS:
+            if pattern in path_lower:
+                risks.append(f"🔴 CRITICAL: {desc} ({pattern})")
 
     if not risks:
         return f"✅ `{path}` - No obvious risk patterns detected"
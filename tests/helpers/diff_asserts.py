@@ -0,0 +1,27 @@
+"""Assertion helpers for diff generation and formatting tests.
+
+These live outside the test modules so pytest only rewrites their bytecode
+once (see `pytest.register_assert_rewrite` in conftest.py), while failures
+still render rich assertion introspection.
+"""
+
+from agent_polis.actions.models import FileChange
+
+
+def assert_change_counts(
+    change: FileChange,
+    *,
+    operation: str,
+    lines_added: int,
+    lines_removed: int,
+) -> None:
+    """Assert the operation and line counts of a generated FileChange."""
+    assert change.operation == operation
+    assert change.lines_added == lines_added
+    assert change.lines_removed == lines_removed
+
+
+def assert_contains_all(text: str, substrings: list[str] | tuple[str, ...]) -> None:
+    """Assert every expected substring appears in the formatted output."""
+    for substring in substrings:
+        assert substring in text
@@ -2,11 +2,9 @@
 A2A Protocol compliance tests.
 """
 
-import pytest
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
 async def test_a2a_agent_card_structure(client: AsyncClient):
     """Test that agent card has required A2A fields."""
     response = await client.get("/.well-known/agent.json")
@@ -25,7 +23,6 @@ async def test_a2a_agent_card_structure(client: AsyncClient):
     assert card["protocol"].startswith("a2a/")
 
 
-@pytest.mark.asyncio
 async def test_a2a_task_send(client: AsyncClient):
     """Test A2A task/send endpoint."""
     response = await client.post(
@@ -56,7 +53,6 @@ async def test_a2a_task_send(client: AsyncClient):
         assert "status" in result["task"]
 
 
-@pytest.mark.asyncio
 async def test_a2a_task_status(client: AsyncClient):
     """Test getting A2A task status."""
     # First create a task
@@ -87,14 +83,12 @@ async def test_a2a_task_status(client: AsyncClient):
     assert "messages" in task
 
 
-@pytest.mark.asyncio
 async def test_a2a_task_not_found(client: AsyncClient):
     """Test 404 for non-existent task."""
     response = await client.get("/a2a/tasks/nonexistent-task-id")
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_a2a_help_response(client: AsyncClient):
     """Test that agent responds to help requests."""
     response = await client.post(
@@ -2,11 +2,16 @@
 Tests for the actions API endpoints.
 """
 
+import json
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 
+# Built once at import; description max length is 500
+_LONG_DESC = "x" * 500
+
 
 @pytest.fixture
 def action_payload():
@@ -19,7 +24,85 @@ def action_payload():
     }
 
 
-@pytest.mark.asyncio
+@pytest_asyncio.fixture
+async def pending_action(
+    async_client: AsyncClient,
+    auth_headers: dict,
+    action_payload: dict,
+) -> str:
+    """Submit a single pending action and return its id.
+
+    Per-endpoint tests consume this instead of each issuing their own
+    POST /actions, which runs the previewer + event append every time.
+    """
+    response = await async_client.post(
+        "/api/v1/actions",
+        json=action_payload,
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+@pytest_asyncio.fixture
+async def seeded_actions(
+    async_client: AsyncClient,
+    auth_headers: dict,
+    action_payload: dict,
+) -> list[str]:
+    """Create a small fixed set of pending actions for listing tests.
+
+    Function-scoped rather than class-scoped because test isolation rolls
+    back the database transaction after every test.
+
+    The POSTs are deliberately sequential: every in-flight request shares
+    the single overridden test session, and AsyncSession is not safe for
+    concurrent use (asyncio.gather here raises on concurrent flushes).
+    """
+    ids = []
+    for _ in range(3):
+        response = await async_client.post(
+            "/api/v1/actions",
+            json=action_payload,
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    return ids
+
+
+@pytest_asyncio.fixture
+async def approved_action(
+    async_client: AsyncClient,
+    auth_headers: dict,
+    pending_action: str,
+) -> str:
+    """Approve the pending action and return its id."""
+    response = await async_client.post(
+        f"/api/v1/actions/{pending_action}/approve",
+        json={},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    return pending_action
+
+
+@pytest_asyncio.fixture
+async def rejected_action(
+    async_client: AsyncClient,
+    auth_headers: dict,
+    pending_action: str,
+) -> str:
+    """Reject the pending action and return its id."""
+    response = await async_client.post(
+        f"/api/v1/actions/{pending_action}/reject",
+        json={"reason": "No"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    return pending_action
+
+
 class TestActionsAPI:
     """Tests for actions API."""
 
@@ -59,17 +142,9 @@ class TestActionsAPI:
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        action_payload: dict,
+        seeded_actions: list[str],
     ):
         """Test listing actions."""
-        # Create an action first
-        await async_client.post(
-            "/api/v1/actions",
-            json=action_payload,
-            headers=auth_headers,
-        )
-
-        # List actions
         response = await async_client.get(
             "/api/v1/actions",
             headers=auth_headers,
@@ -80,22 +155,15 @@ class TestActionsAPI:
         assert "actions" in data
         assert "total" in data
         assert "pending_count" in data
+        assert data["total"] >= len(seeded_actions)
 
     async def test_list_pending_actions(
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        action_payload: dict,
+        seeded_actions: list[str],
     ):
         """Test listing pending actions."""
-        # Create an action
-        await async_client.post(
-            "/api/v1/actions",
-            json=action_payload,
-            headers=auth_headers,
-        )
-
-        # List pending
         response = await async_client.get(
             "/api/v1/actions/pending",
             headers=auth_headers,
@@ -103,51 +171,33 @@ class TestActionsAPI:
 
         assert response.status_code == 200
         data = response.json()
-        assert data["pending_count"] >= 1
+        assert data["pending_count"] >= len(seeded_actions)
 
     async def test_get_action(
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        action_payload: dict,
+        pending_action: str,
     ):
         """Test getting action details."""
-        # Create an action
-        create_response = await async_client.post(
-            "/api/v1/actions",
-            json=action_payload,
-            headers=auth_headers,
-        )
-        action_id = create_response.json()["id"]
-
-        # Get action
         response = await async_client.get(
-            f"/api/v1/actions/{action_id}",
+            f"/api/v1/actions/{pending_action}",
             headers=auth_headers,
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert data["id"] == action_id
+        assert data["id"] == pending_action
 
     async def test_get_action_preview(
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        action_payload: dict,
+        pending_action: str,
     ):
         """Test getting action preview."""
-        # Create an action
-        create_response = await async_client.post(
-            "/api/v1/actions",
-            json=action_payload,
-            headers=auth_headers,
-        )
-        action_id = create_response.json()["id"]
-
-        # Get preview
         response = await async_client.get(
-            f"/api/v1/actions/{action_id}/preview",
+            f"/api/v1/actions/{pending_action}/preview",
             headers=auth_headers,
         )
 
@@ -160,20 +210,11 @@ class TestActionsAPI:
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        action_payload: dict,
+        pending_action: str,
     ):
         """Test getting action diff."""
-        # Create an action
-        create_response = await async_client.post(
-            "/api/v1/actions",
-            json=action_payload,
-            headers=auth_headers,
-        )
-        action_id = create_response.json()["id"]
-
-        # Get diff (plain format)
         response = await async_client.get(
-            f"/api/v1/actions/{action_id}/diff?format=plain",
+            f"/api/v1/actions/{pending_action}/diff?format=plain",
             headers=auth_headers,
         )
 
@@ -185,20 +226,11 @@ class TestActionsAPI:
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        action_payload: dict,
+        pending_action: str,
     ):
         """Test approving an action."""
-        # Create an action
-        create_response = await async_client.post(
-            "/api/v1/actions",
-            json=action_payload,
-            headers=auth_headers,
-        )
-        action_id = create_response.json()["id"]
-
-        # Approve
         response = await async_client.post(
-            f"/api/v1/actions/{action_id}/approve",
+            f"/api/v1/actions/{pending_action}/approve",
             json={"comment": "Looks good"},
             headers=auth_headers,
         )
@@ -212,20 +244,11 @@ class TestActionsAPI:
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        action_payload: dict,
+        pending_action: str,
     ):
         """Test rejecting an action."""
-        # Create an action
-        create_response = await async_client.post(
-            "/api/v1/actions",
-            json=action_payload,
-            headers=auth_headers,
-        )
-        action_id = create_response.json()["id"]
-
-        # Reject
         response = await async_client.post(
-            f"/api/v1/actions/{action_id}/reject",
+            f"/api/v1/actions/{pending_action}/reject",
             json={"reason": "Too risky"},
             headers=auth_headers,
         )
@@ -239,20 +262,11 @@ class TestActionsAPI:
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        action_payload: dict,
+        pending_action: str,
     ):
         """Test that rejection requires a reason."""
-        # Create an action
-        create_response = await async_client.post(
-            "/api/v1/actions",
-            json=action_payload,
-            headers=auth_headers,
-        )
-        action_id = create_response.json()["id"]
-
-        # Try to reject without reason
         response = await async_client.post(
-            f"/api/v1/actions/{action_id}/reject",
+            f"/api/v1/actions/{pending_action}/reject",
             json={},
             headers=auth_headers,
         )
@@ -263,26 +277,11 @@ class TestActionsAPI:
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        action_payload: dict,
+        approved_action: str,
     ):
         """Test executing an approved action."""
-        # Create and approve
-        create_response = await async_client.post(
-            "/api/v1/actions",
-            json=action_payload,
-            headers=auth_headers,
-        )
-        action_id = create_response.json()["id"]
-
-        await async_client.post(
-            f"/api/v1/actions/{action_id}/approve",
-            json={},
-            headers=auth_headers,
-        )
-
-        # Execute
         response = await async_client.post(
-            f"/api/v1/actions/{action_id}/execute",
+            f"/api/v1/actions/{approved_action}/execute",
             headers=auth_headers,
         )
 
@@ -295,20 +294,11 @@ class TestActionsAPI:
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        action_payload: dict,
+        pending_action: str,
     ):
         """Test that pending actions cannot be executed."""
-        # Create (but don't approve)
-        create_response = await async_client.post(
-            "/api/v1/actions",
-            json=action_payload,
-            headers=auth_headers,
-        )
-        action_id = create_response.json()["id"]
-
-        # Try to execute
         response = await async_client.post(
-            f"/api/v1/actions/{action_id}/execute",
+            f"/api/v1/actions/{pending_action}/execute",
             headers=auth_headers,
         )
 
@@ -318,26 +308,11 @@ class TestActionsAPI:
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        action_payload: dict,
+        rejected_action: str,
     ):
         """Test that rejected actions cannot be approved."""
-        # Create and reject
-        create_response = await async_client.post(
-            "/api/v1/actions",
-            json=action_payload,
-            headers=auth_headers,
-        )
-        action_id = create_response.json()["id"]
-
-        await async_client.post(
-            f"/api/v1/actions/{action_id}/reject",
-            json={"reason": "No"},
-            headers=auth_headers,
-        )
-
-        # Try to approve
         response = await async_client.post(
-            f"/api/v1/actions/{action_id}/approve",
+            f"/api/v1/actions/{rejected_action}/approve",
             json={},
             headers=auth_headers,
         )
@@ -348,20 +323,11 @@ class TestActionsAPI:
         self,
         async_client: AsyncClient,
         auth_headers: dict,
-        action_payload: dict,
+        pending_action: str,
     ):
         """Test getting action audit trail."""
-        # Create an action
-        create_response = await async_client.post(
-            "/api/v1/actions",
-            json=action_payload,
-            headers=auth_headers,
-        )
-        action_id = create_response.json()["id"]
-
-        # Get events
         response = await async_client.get(
-            f"/api/v1/actions/{action_id}/events",
+            f"/api/v1/actions/{pending_action}/events",
             headers=auth_headers,
         )
 
@@ -380,6 +346,26 @@ class TestActionsAPI:
         assert preview_event["data"]["governance"]["policy"]["decision"] == "require_approval"
         assert preview_event["data"]["governance"]["scanner"]["max_severity"] == "low"
 
+    async def test_get_action_events_ndjson(
+        self,
+        async_client: AsyncClient,
+        auth_headers: dict,
+        pending_action: str,
+    ):
+        """Test streaming the audit trail as newline-delimited JSON."""
+        response = await async_client.get(
+            f"/api/v1/actions/{pending_action}/events",
+            headers={**auth_headers, "accept": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        events = [json.loads(line) for line in response.text.splitlines()]
+        event_types = [e["type"] for e in events]
+        assert "ActionProposed" in event_types
+        assert "ActionPreviewGenerated" in event_types
+
     async def test_auto_approve_low_risk(
         self,
         async_client: AsyncClient,
@@ -407,7 +393,6 @@ class TestActionsAPI:
         assert data["status"] in ["pending", "approved"]
 
 
-@pytest.mark.asyncio
 class TestActionsAPIEdgeCases:
     """Edge case tests for actions API."""
 
@@ -425,65 +410,51 @@ class TestActionsAPIEdgeCases:
 
         assert response.status_code == 404
 
-    async def test_invalid_action_type(
-        self,
-        async_client: AsyncClient,
-        auth_headers: dict,
-    ):
-        """Test submitting with invalid action type."""
-        payload = {
-            "action_type": "invalid_type",
-            "target": "/test",
-            "description": "Test",
-        }
-
-        response = await async_client.post(
-            "/api/v1/actions",
-            json=payload,
-            headers=auth_headers,
-        )
-
-        assert response.status_code == 422
-
-    async def test_action_with_long_description(
-        self,
-        async_client: AsyncClient,
-        auth_headers: dict,
-    ):
-        """Test action with description at max length."""
-        payload = {
-            "action_type": "file_write",
-            "target": "/test",
-            "description": "x" * 500,  # Max length
-            "payload": {},
-        }
-
-        response = await async_client.post(
-            "/api/v1/actions",
-            json=payload,
-            headers=auth_headers,
-        )
-
-        assert response.status_code == 201
-
-    async def test_action_with_callback_url(
+    @pytest.mark.parametrize(
+        ("payload", "expected_status"),
+        [
+            pytest.param(
+                {
+                    "action_type": "invalid_type",
+                    "target": "/test",
+                    "description": "Test",
+                },
+                422,
+                id="invalid-action-type",
+            ),
+            pytest.param(
+                {
+                    "action_type": "file_write",
+                    "target": "/test",
+                    "description": _LONG_DESC,
+                },
+                201,
+                id="max-length-description",
+            ),
+            pytest.param(
+                {
+                    "action_type": "file_write",
+                    "target": "/test",
+                    "description": "Test with callback",
+                    "callback_url": "https://example.com/webhook",
+                },
+                201,
+                id="callback-url",
+            ),
+        ],
+    )
+    async def test_submit_validation(
         self,
         async_client: AsyncClient,
         auth_headers: dict,
+        payload: dict,
+        expected_status: int,
     ):
-        """Test action with callback URL."""
-        payload = {
-            "action_type": "file_write",
-            "target": "/test",
-            "description": "Test with callback",
-            "payload": {},
-            "callback_url": "https://example.com/webhook",
-        }
-
+        """Test submission validation edge cases."""
         response = await async_client.post(
             "/api/v1/actions",
             json=payload,
             headers=auth_headers,
         )
 
-        assert response.status_code == 201
+        assert response.status_code == expected_status
@@ -2,11 +2,9 @@
 Agent registration and management tests.
 """
 
-import pytest
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
 async def test_register_agent(client: AsyncClient):
     """Test agent registration."""
     response = await client.post(
@@ -26,7 +24,6 @@ async def test_register_agent(client: AsyncClient):
     assert data["api_key"].startswith("ap_")
 
 
-@pytest.mark.asyncio
 async def test_register_duplicate_name(client: AsyncClient):
     """Test that duplicate agent names are rejected."""
     # First registration
@@ -51,7 +48,6 @@ async def test_register_duplicate_name(client: AsyncClient):
     assert "already taken" in response2.json()["detail"]
 
 
-@pytest.mark.asyncio
 async def test_invalid_agent_name(client: AsyncClient):
     """Test that invalid agent names are rejected."""
     response = await client.post(
@@ -64,7 +60,6 @@ async def test_invalid_agent_name(client: AsyncClient):
     assert response.status_code == 422  # Validation error
 
 
-@pytest.mark.asyncio
 async def test_get_current_agent(client: AsyncClient, registered_agent: dict, auth_headers: dict):
     """Test getting current agent profile."""
     response = await client.get(
@@ -78,7 +73,6 @@ async def test_get_current_agent(client: AsyncClient, registered_agent: dict, au
     assert data["status"] == "active"
 
 
-@pytest.mark.asyncio
 async def test_get_agent_stats(client: AsyncClient, auth_headers: dict):
     """Test getting agent statistics."""
     response = await client.get(
@@ -93,14 +87,12 @@ async def test_get_agent_stats(client: AsyncClient, auth_headers: dict):
     assert "monthly_limit" in data
 
 
-@pytest.mark.asyncio
 async def test_unauthorized_access(client: AsyncClient):
     """Test that unauthenticated requests are rejected."""
     response = await client.get("/api/v1/agents/me")
     assert response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_invalid_api_key(client: AsyncClient):
     """Test that invalid API keys are rejected."""
     response = await client.get(
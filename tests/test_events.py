@@ -2,7 +2,6 @@
 Event sourcing infrastructure tests.
 """
 
-import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agent_polis.events.bus import EventBus
@@ -10,7 +9,6 @@ from agent_polis.events.store import EventStore
 from agent_polis.events.types import AgentRegistered, DomainEvent
 
 
-@pytest.mark.asyncio
 async def test_event_append(test_session: AsyncSession):
     """Test appending events to the store."""
     store = EventStore(test_session)
@@ -25,7 +23,6 @@ async def test_event_append(test_session: AsyncSession):
     )
 
     db_event = await store.append(event)
-    await test_session.commit()
 
     assert db_event.stream_id == "agent:test-123"
     assert db_event.event_type == "AgentRegistered"
@@ -33,23 +30,23 @@ async def test_event_append(test_session: AsyncSession):
     assert db_event.hash is not None
 
 
-@pytest.mark.asyncio
 async def test_event_versioning(test_session: AsyncSession):
     """Test that event versions increment correctly."""
     store = EventStore(test_session)
     stream_id = "agent:version-test"
 
-    # Append multiple events
-    for i in range(3):
-        event = DomainEvent(
-            stream_id=stream_id,
-            event_type="TestEvent",
-            data={"index": i},
-        )
-        db_event = await store.append(event)
-        assert db_event.stream_version == i + 1
-
-    await test_session.commit()
+    # Append multiple events as one batch
+    db_events = await store.append_many(
+        [
+            DomainEvent(
+                stream_id=stream_id,
+                event_type="TestEvent",
+                data={"index": i},
+            )
+            for i in range(3)
+        ]
+    )
+    assert [e.stream_version for e in db_events] == [1, 2, 3]
 
     # Verify all events
     events = await store.get_stream(stream_id)
@@ -57,22 +54,22 @@ async def test_event_versioning(test_session: AsyncSession):
     assert [e.stream_version for e in events] == [1, 2, 3]
 
 
-@pytest.mark.asyncio
 async def test_event_hash_chain(test_session: AsyncSession):
     """Test hash chain integrity."""
     store = EventStore(test_session)
     stream_id = "agent:hash-test"
 
-    # Create chain of events
-    for i in range(3):
-        event = DomainEvent(
-            stream_id=stream_id,
-            event_type="ChainEvent",
-            data={"index": i},
-        )
-        await store.append(event)
-
-    await test_session.commit()
+    # Create chain of events in one batch
+    await store.append_many(
+        [
+            DomainEvent(
+                stream_id=stream_id,
+                event_type="ChainEvent",
+                data={"index": i},
+            )
+            for i in range(3)
+        ]
+    )
 
     # Verify chain
     events = await store.get_stream(stream_id)
@@ -85,71 +82,53 @@ async def test_event_hash_chain(test_session: AsyncSession):
         assert events[i].prev_hash == events[i-1].hash
 
 
-@pytest.mark.asyncio
 async def test_stream_integrity_verification(test_session: AsyncSession):
     """Test stream integrity verification."""
     store = EventStore(test_session)
     stream_id = "agent:integrity-test"
 
-    # Create events
-    for i in range(3):
-        event = DomainEvent(
-            stream_id=stream_id,
-            event_type="IntegrityEvent",
-            data={"index": i},
-        )
-        await store.append(event)
-
-    await test_session.commit()
+    # Create events in one batch
+    await store.append_many(
+        [
+            DomainEvent(
+                stream_id=stream_id,
+                event_type="IntegrityEvent",
+                data={"index": i},
+            )
+            for i in range(3)
+        ]
+    )
 
     # Verify integrity
     is_valid = await store.verify_stream_integrity(stream_id)
     assert is_valid is True
 
 
-@pytest.mark.asyncio
-async def test_event_bus_publish_subscribe():
-    """Test event bus publish/subscribe."""
+async def test_event_bus_direct_and_global_handlers():
+    """Test publish/subscribe with typed and global handlers on one bus."""
     bus = EventBus()
-    received_events = []
+    direct_events = []
+    global_types = []
 
     async def handler(event: DomainEvent):
-        received_events.append(event)
-
-    # Subscribe
-    bus.subscribe("TestEvent", handler)
-
-    # Publish
-    event = DomainEvent(
-        stream_id="test:bus",
-        event_type="TestEvent",
-        data={"message": "hello"},
-    )
-    await bus.publish(event)
-
-    # Verify
-    assert len(received_events) == 1
-    assert received_events[0].data["message"] == "hello"
-
-
-@pytest.mark.asyncio
-async def test_event_bus_global_handler():
-    """Test event bus global (all events) handler."""
-    bus = EventBus()
-    received = []
+        direct_events.append(event)
 
     async def global_handler(event: DomainEvent):
-        received.append(event.event_type)
+        global_types.append(event.event_type)
 
+    bus.subscribe("EventA", handler)
     bus.subscribe_all(global_handler)
 
-    # Publish different event types
+    # Publishes stay sequential so the global handler's ordering is exact
     for event_type in ["EventA", "EventB", "EventC"]:
         event = DomainEvent(
-            stream_id="test:global",
+            stream_id="test:bus",
             event_type=event_type,
-            data={},
+            data={"message": "hello"},
         )
         await bus.publish(event)
 
-    assert received == ["EventA", "EventB", "EventC"]
+    # Typed handler only sees its event type; global handler sees all
+    assert len(direct_events) == 1
+    assert direct_events[0].data["message"] == "hello"
+    assert global_types == ["EventA", "EventB", "EventC"]
@@ -1,5 +1,6 @@
 """Tests for MCP descriptor integrity checks and hash pinning."""
 
+import copy
 import json
 
 import pytest
@@ -10,44 +11,50 @@ from agent_polis.governance import (
     load_descriptor_integrity_policy_from_dict,
 )
 
+# Frozen descriptor template. Tests that mutate their payload (only the
+# tamper test does) get a deep copy via _descriptor_payload().
+_TEMPLATE: dict = {
+    "$schema": "https://static.modelcontextprotocol.io/schemas/2025-12-11/server.schema.json",
+    "name": "io.github.agent-polis/impact-preview",
+    "description": "Impact preview for AI agents",
+    "version": "0.2.2",
+    "packages": [
+        {
+            "registryType": "pypi",
+            "identifier": "impact-preview",
+            "version": "0.2.2",
+            "transport": {"type": "stdio"},
+        }
+    ],
+}
+
+# Canonical hash of the untampered payload, computed once for the module
+# instead of re-serializing and re-hashing the same dict in every test.
+_PINNED_HASH = compute_descriptor_hash(_TEMPLATE)
+
 
 def _descriptor_payload() -> dict:
-    return {
-        "$schema": "https://static.modelcontextprotocol.io/schemas/2025-12-11/server.schema.json",
-        "name": "io.github.agent-polis/impact-preview",
-        "description": "Impact preview for AI agents",
-        "version": "0.2.2",
-        "packages": [
-            {
-                "registryType": "pypi",
-                "identifier": "impact-preview",
-                "version": "0.2.2",
-                "transport": {"type": "stdio"},
-            }
-        ],
-    }
+    return copy.deepcopy(_TEMPLATE)
 
 
 def test_descriptor_integrity_allows_pinned_allowlist_hash() -> None:
-    descriptor = _descriptor_payload()
-    descriptor_hash = compute_descriptor_hash(descriptor)
+    descriptor = _TEMPLATE
     policy = load_descriptor_integrity_policy_from_dict(
-        {"allowlist": {descriptor["name"]: [descriptor_hash]}}
+        {"allowlist": {descriptor["name"]: [_PINNED_HASH]}}
     )
     checker = DescriptorIntegrityChecker()
 
     result = checker.evaluate(policy=policy, descriptor=descriptor)
 
     assert result.allowed
-    assert result.matched_pin == descriptor_hash
+    assert result.matched_pin == _PINNED_HASH
     assert "matched allowlist pin" in result.reason
 
 
 def test_descriptor_integrity_blocks_tampered_descriptor() -> None:
     descriptor = _descriptor_payload()
-    pinned_hash = compute_descriptor_hash(descriptor)
     policy = load_descriptor_integrity_policy_from_dict(
-        {"allowlist": {descriptor["name"]: [pinned_hash]}}
+        {"allowlist": {descriptor["name"]: [_PINNED_HASH]}}
     )
     checker = DescriptorIntegrityChecker()
 
@@ -59,7 +66,7 @@ def test_descriptor_integrity_blocks_tampered_descriptor() -> None:
 
 
 def test_descriptor_integrity_blocks_missing_allowlist_pin() -> None:
-    descriptor = _descriptor_payload()
+    descriptor = _TEMPLATE
     policy = load_descriptor_integrity_policy_from_dict({"allowlist": {}})
     checker = DescriptorIntegrityChecker()
 
@@ -70,9 +77,9 @@ def test_descriptor_integrity_blocks_missing_allowlist_pin() -> None:
 
 
 def test_descriptor_integrity_reports_explicit_pin_mismatch() -> None:
-    descriptor = _descriptor_payload()
+    descriptor = _TEMPLATE
     policy = load_descriptor_integrity_policy_from_dict(
-        {"allowlist": {descriptor["name"]: [compute_descriptor_hash(descriptor)]}}
+        {"allowlist": {descriptor["name"]: [_PINNED_HASH]}}
     )
     checker = DescriptorIntegrityChecker()
     bad_hash = "sha256:" + ("f" * 64)
@@ -88,11 +95,11 @@ def test_descriptor_integrity_reports_explicit_pin_mismatch() -> None:
 
 
 def test_descriptor_integrity_file_evaluation(tmp_path) -> None:
-    descriptor = _descriptor_payload()
+    descriptor = _TEMPLATE
     descriptor_path = tmp_path / "descriptor.json"
     descriptor_path.write_text(json.dumps(descriptor), encoding="utf-8")
     policy = load_descriptor_integrity_policy_from_dict(
-        {"allowlist": {descriptor["name"]: [compute_descriptor_hash(descriptor)]}}
+        {"allowlist": {descriptor["name"]: [_PINNED_HASH]}}
     )
     checker = DescriptorIntegrityChecker()
 
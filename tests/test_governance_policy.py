@@ -49,14 +49,19 @@ def test_load_policy_from_dict_parses_rules() -> None:
     assert policy.rules[0].max_risk_level == RiskLevel.MEDIUM
 
 
-def test_load_policy_from_file_json(tmp_path) -> None:
-    policy_data = {
+# Serialized once at import; the file test only needs the bytes on disk.
+_POLICY_JSON_BYTES = json.dumps(
+    {
         "version": "1",
         "defaults": {"decision": "deny"},
         "rules": [{"id": "allow-safe", "decision": "allow", "max_risk_level": "low"}],
     }
+).encode("utf-8")
+
+
+def test_load_policy_from_file_json(tmp_path) -> None:
     policy_path = tmp_path / "policy.json"
-    policy_path.write_text(json.dumps(policy_data), encoding="utf-8")
+    policy_path.write_bytes(_POLICY_JSON_BYTES)
 
     policy = load_policy_from_file(policy_path)
 
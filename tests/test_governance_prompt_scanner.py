@@ -1,8 +1,6 @@
 """Tests for prompt injection and risky-instruction scanner."""
 
-import pytest
 
-from agent_polis.actions.analyzer import ImpactAnalyzer
 from agent_polis.actions.models import ActionRequest, ActionType, RiskLevel
 from agent_polis.governance import PromptInjectionScanner
 
@@ -115,9 +113,8 @@ def test_scanner_benign_text_no_critical_findings() -> None:
     assert all(f.severity.value != "critical" for f in result.findings)
 
 
-@pytest.mark.asyncio
-async def test_analyzer_escalates_risk_on_injection_findings(tmp_path) -> None:
-    analyzer = ImpactAnalyzer(working_directory=str(tmp_path))
+async def test_analyzer_escalates_risk_on_injection_findings(tmp_path, shared_analyzer) -> None:
+    analyzer = shared_analyzer.with_working_directory(tmp_path)
     req = ActionRequest(
         action_type=ActionType.FILE_WRITE,
         target="notes.txt",
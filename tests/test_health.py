@@ -2,11 +2,9 @@
 Basic health check tests.
 """
 
-import pytest
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
 async def test_health_check(client: AsyncClient):
     """Test the health check endpoint."""
     response = await client.get("/health")
@@ -18,7 +16,6 @@ async def test_health_check(client: AsyncClient):
     assert "environment" in data
 
 
-@pytest.mark.asyncio
 async def test_agent_card(client: AsyncClient):
     """Test the A2A agent card endpoint."""
     response = await client.get("/.well-known/agent.json")
@@ -6,6 +6,10 @@ These test the impact preview tools directly without going through HTTP.
 
 import pytest
 
+# Skip collection outright in environments without a compatible MCP SDK
+# instead of failing at import and dragging the rest of the run with it.
+pytest.importorskip("mcp.server.fastmcp")
+
 from agent_polis.actions.models import RiskLevel
 from agent_polis.mcp_server import (
     _risk_emoji,
@@ -62,8 +66,6 @@ class TestCheckPathRisk:
 
 class TestPreviewFileWrite:
     """Test file write preview tool."""
-
-    @pytest.mark.asyncio
     async def test_preview_simple_write(self, tmp_path):
         # Create a test file
         test_file = tmp_path / "test.txt"
@@ -79,8 +81,6 @@ class TestPreviewFileWrite:
         assert "Risk:" in result
         assert "LOW" in result or "MEDIUM" in result
         assert "Diff:" in result
-
-    @pytest.mark.asyncio
     async def test_preview_new_file_write(self, tmp_path):
         new_file = tmp_path / "new_file.txt"
 
@@ -96,8 +96,6 @@ class TestPreviewFileWrite:
 
 class TestPreviewFileCreate:
     """Test file create preview tool."""
-
-    @pytest.mark.asyncio
     async def test_preview_file_create(self, tmp_path):
         new_file = tmp_path / "new_file.py"
 
@@ -114,8 +112,6 @@ class TestPreviewFileCreate:
 
 class TestPreviewFileDelete:
     """Test file delete preview tool."""
-
-    @pytest.mark.asyncio
     async def test_preview_delete(self, tmp_path):
         # Create a file to delete
         test_file = tmp_path / "to_delete.txt"
@@ -132,8 +128,6 @@ class TestPreviewFileDelete:
 
 class TestPreviewShellCommand:
     """Test shell command preview tool."""
-
-    @pytest.mark.asyncio
     async def test_safe_command(self):
         result = await preview_shell_command(
             command="ls -la",
@@ -142,8 +136,6 @@ class TestPreviewShellCommand:
 
         assert "Shell Command Preview" in result
         assert "Risk:" in result
-
-    @pytest.mark.asyncio
     async def test_dangerous_command(self):
         result = await preview_shell_command(
             command="rm -rf /",
@@ -157,8 +149,6 @@ class TestPreviewShellCommand:
 
 class TestPreviewDatabaseQuery:
     """Test database query preview tool."""
-
-    @pytest.mark.asyncio
     async def test_select_query(self):
         result = await preview_database_query(
             query="SELECT * FROM users WHERE id = 1",
@@ -167,8 +157,6 @@ class TestPreviewDatabaseQuery:
 
         assert "Database Query Preview" in result
         assert "Risk:" in result
-
-    @pytest.mark.asyncio
     async def test_delete_query(self):
         result = await preview_database_query(
             query="DELETE FROM users WHERE active = false",
@@ -178,8 +166,6 @@ class TestPreviewDatabaseQuery:
         assert "Database Query Preview" in result
         # DELETE should be higher risk
         assert "Risk:" in result
-
-    @pytest.mark.asyncio
     async def test_drop_table(self):
         result = await preview_database_query(
             query="DROP TABLE users",
@@ -2,11 +2,38 @@
 Simulation creation and execution tests.
 """
 
-import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
+@pytest_asyncio.fixture
+async def seeded_simulations(client: AsyncClient, auth_headers: dict) -> list[str]:
+    """Create a small fixed set of simulations for listing tests.
+
+    Function-scoped rather than session-scoped because test isolation
+    rolls back the database transaction after every test. The POSTs are
+    deliberately sequential: every in-flight request shares the single
+    overridden test session, and AsyncSession is not safe for concurrent
+    use (asyncio.gather here raises on concurrent flushes).
+    """
+    ids = []
+    for n in range(3):
+        response = await client.post(
+            "/api/v1/simulations",
+            headers=auth_headers,
+            json={
+                "scenario": {
+                    "name": f"Seeded Simulation {n}",
+                    "code": "result = True",
+                    "inputs": {},
+                }
+            },
+        )
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    return ids
+
+
 async def test_create_simulation(client: AsyncClient, auth_headers: dict):
     """Test creating a simulation."""
     response = await client.post(
@@ -30,7 +57,6 @@ async def test_create_simulation(client: AsyncClient, auth_headers: dict):
     assert "id" in data
 
 
-@pytest.mark.asyncio
 async def test_run_simulation(client: AsyncClient, auth_headers: dict):
     """Test running a simulation."""
     # Create simulation
@@ -61,7 +87,6 @@ async def test_run_simulation(client: AsyncClient, auth_headers: dict):
     assert result["output"] == {"value": 42}
 
 
-@pytest.mark.asyncio
 async def test_simulation_with_inputs(client: AsyncClient, auth_headers: dict):
     """Test simulation with input variables."""
     create_response = await client.post(
@@ -90,7 +115,6 @@ async def test_simulation_with_inputs(client: AsyncClient, auth_headers: dict):
     assert result["output"] == 42
 
 
-@pytest.mark.asyncio
 async def test_simulation_failure(client: AsyncClient, auth_headers: dict):
     """Test simulation that fails."""
     create_response = await client.post(
@@ -119,22 +143,12 @@ async def test_simulation_failure(client: AsyncClient, auth_headers: dict):
     assert "intentional error" in result["error"]
 
 
-@pytest.mark.asyncio
-async def test_list_simulations(client: AsyncClient, auth_headers: dict):
+async def test_list_simulations(
+    client: AsyncClient,
+    auth_headers: dict,
+    seeded_simulations: list[str],
+):
     """Test listing simulations."""
-    # Create a simulation first
-    await client.post(
-        "/api/v1/simulations",
-        headers=auth_headers,
-        json={
-            "scenario": {
-                "name": "List Test",
-                "code": "result = True",
-                "inputs": {},
-            }
-        },
-    )
-
     response = await client.get(
         "/api/v1/simulations",
         headers=auth_headers,
@@ -144,10 +158,9 @@ async def test_list_simulations(client: AsyncClient, auth_headers: dict):
     data = response.json()
     assert "simulations" in data
     assert "total" in data
-    assert len(data["simulations"]) >= 1
+    assert len(data["simulations"]) >= len(seeded_simulations)
 
 
-@pytest.mark.asyncio
 async def test_get_simulation_events(client: AsyncClient, auth_headers: dict):
     """Test getting simulation event audit trail."""
     # Create and run a simulation
@@ -183,7 +196,6 @@ async def test_get_simulation_events(client: AsyncClient, auth_headers: dict):
     assert "SimulationCreated" in event_types
 
 
-@pytest.mark.asyncio
 async def test_record_prediction(client: AsyncClient, auth_headers: dict):
     """Test recording outcome predictions."""
     # Create simulation